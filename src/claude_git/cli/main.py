@@ -23,6 +23,9 @@ from claude_git.core.git_native_repository import GitNativeRepository
 
 console = Console()
 
+# Icons shown next to the tool that produced a change
+TOOL_ICONS = {"write": "📝", "edit": "✏️ ", "delete": "🗑️ ", "unknown": "❓"}
+
 
 def run_claude_git_command(
     claude_git_dir: Path, git_args: List[str]
@@ -323,7 +326,7 @@ def diff(
 
         # Default behavior - show recent changes like git diff
         diff_results = git_native_repo.get_meaningful_diff(
-            limit, parent_hash=parent_hash, paths=parsed_args.get("paths")
+            limit, paths=parsed_args.get("paths")
         )
 
         if not diff_results["changes_analyzed"]:
@@ -458,14 +461,14 @@ def show(commit_hash: Optional[str]):
             try:
                 commit = git_native_repo.repo.commit(commit_hash)
                 json_files = [
-                    f for f in commit.tree.traverse() if f.name.endswith(".json")
+                    commit.tree / path
+                    for path in git_native_repo.list_commit_paths(commit.hexsha)
+                    if path.endswith(".json")
                 ]
                 if json_files:
                     import json
 
-                    change_data = json.loads(
-                        json_files[0].data_stream.read().decode("utf-8")
-                    )
+                    change_data = json.loads(json_files[0].data_stream.read())
                     if (
                         "parent_repo_hash" in change_data
                         and change_data["parent_repo_hash"]
@@ -515,7 +518,11 @@ def apply(commit_hash: str, dry_run: bool):
         )
 
         # Find patch files in this commit
-        patch_files = [f for f in commit.tree.traverse() if f.name.endswith(".patch")]
+        patch_files = [
+            commit.tree / path
+            for path in git_native_repo.list_commit_paths(commit.hexsha)
+            if path.endswith(".patch")
+        ]
 
         if not patch_files:
             console.print("[red]No patch file found in this commit[/red]")
@@ -560,10 +567,14 @@ def rollback(commit_hash: str):
         )
 
         # Find JSON files to get the original change data
-        json_files = [f for f in commit.tree.traverse() if f.name.endswith(".json")]
+        json_files = [
+            commit.tree / path
+            for path in git_native_repo.list_commit_paths(commit.hexsha)
+            if path.endswith(".json")
+        ]
 
         for json_file in json_files:
-            change_data = json.loads(json_file.data_stream.read().decode("utf-8"))
+            change_data = json.loads(json_file.data_stream.read())
 
             # Create reverse patch
             if change_data["old_string"] and change_data["new_string"]:
@@ -714,19 +725,8 @@ def find_by_parent(parent_hash: str):
 
         for commit in git_native_repo.repo.iter_commits():
             try:
-                json_files = [
-                    f
-                    for f in commit.tree.traverse()
-                    if f.name.endswith(".json") and "changes/" in str(f.path)
-                ]
-                for json_file in json_files:
+                for change_data in _load_change_records(git_native_repo, commit):
                     try:
-                        change_data = json.loads(
-                            json_file.data_stream.read().decode("utf-8")
-                        )
-                        # Skip if not a change record (must have 'id' field)
-                        if not change_data.get("id"):
-                            continue
                         parent_repo_hash = change_data.get("parent_repo_hash", "")
                         if (
                             parent_repo_hash
@@ -734,7 +734,7 @@ def find_by_parent(parent_hash: str):
                         ) or parent_hash in commit.message:
                             matching_commits.append((commit, change_data))
                             break
-                    except (json.JSONDecodeError, KeyError):
+                    except KeyError:
                         continue
             except Exception:
                 continue
@@ -801,21 +801,8 @@ def conflicts(session_id: Optional[str], limit: int):
         conflicts_found = 0
 
         for commit in commits:
-            # Find JSON files in this commit
-            json_files = [
-                f
-                for f in commit.tree.traverse()
-                if f.name.endswith(".json") and "changes/" in str(f.path)
-            ]
-
-            for json_file in json_files:
+            for change_data in _load_change_records(git_native_repo, commit):
                 try:
-                    change_data = json.loads(
-                        json_file.data_stream.read().decode("utf-8")
-                    )
-                    if not change_data.get("id"):  # Skip non-change files
-                        continue
-
                     conflict_analysis = change_data.get("conflict_analysis", {})
 
                     if conflict_analysis.get("has_conflicts"):
@@ -865,7 +852,7 @@ def conflicts(session_id: Optional[str], limit: int):
                                 f"[dim]Human changes: {', '.join(summary_parts)}[/dim]"
                             )
 
-                except (json.JSONDecodeError, KeyError):
+                except KeyError:
                     continue
 
         if conflicts_found == 0:
@@ -902,17 +889,13 @@ def resolve(commit_hash: str):
         )
 
         # Find the change data
-        json_files = [
-            f
-            for f in commit.tree.traverse()
-            if f.name.endswith(".json") and "changes/" in str(f.path)
-        ]
+        change_records = _load_change_records(git_native_repo, commit)
 
-        if not json_files:
+        if not change_records:
             console.print("[red]No change data found in this commit[/red]")
             return
 
-        change_data = json.loads(json_files[0].data_stream.read().decode("utf-8"))
+        change_data = change_records[0]
         conflict_analysis = change_data.get("conflict_analysis", {})
 
         if not conflict_analysis.get("has_conflicts"):
@@ -1008,20 +991,8 @@ def analyze(session_id: Optional[str], include_clean: bool):
         claude_activity_score = 0
 
         for commit in commits:
-            json_files = [
-                f
-                for f in commit.tree.traverse()
-                if f.name.endswith(".json") and "changes/" in str(f.path)
-            ]
-
-            for json_file in json_files:
+            for change_data in _load_change_records(git_native_repo, commit):
                 try:
-                    change_data = json.loads(
-                        json_file.data_stream.read().decode("utf-8")
-                    )
-                    if not change_data.get("id"):
-                        continue
-
                     analysis["total_changes"] += 1
                     claude_activity_score += 1
 
@@ -1057,7 +1028,7 @@ def analyze(session_id: Optional[str], include_clean: bool):
                         if len(human_mods) > 3:
                             analysis["conflict_patterns"]["high_activity_periods"] += 1
 
-                except (json.JSONDecodeError, KeyError):
+                except KeyError:
                     continue
 
         # Generate intelligent recommendations
@@ -1178,6 +1149,22 @@ def setup_hooks():
     setup_hooks_main()
 
 
+def _load_change_records(git_native_repo, commit) -> List[Dict]:
+    """Load the change record JSON files stored under changes/ in a commit."""
+    records = []
+    for path in git_native_repo.list_commit_paths(commit.hexsha):
+        if not (path.endswith(".json") and "changes/" in path):
+            continue
+        try:
+            change_data = json.loads((commit.tree / path).data_stream.read())
+        except json.JSONDecodeError:
+            continue
+        # Skip if not a change record (must have 'id' field)
+        if change_data.get("id"):
+            records.append(change_data)
+    return records
+
+
 def _process_git_diff_args(args):
     """Process git diff arguments for git-native execution."""
     processed_args = []
@@ -1698,8 +1685,7 @@ def _display_change_analysis(change, verbose=False):
 
     # Show tool call information
     change_type = change.get("change_type", "unknown")
-    tool_icons = {"write": "📝", "edit": "✏️ ", "delete": "🗑️ ", "unknown": "❓"}
-    tool_icon = tool_icons.get(change_type, "❓")
+    tool_icon = TOOL_ICONS.get(change_type, TOOL_ICONS["unknown"])
     console.print(f"   [dim]{tool_icon} Tool: {change_type.title()}[/dim]")
 
     # Show parent repo hash if available
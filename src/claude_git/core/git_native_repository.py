@@ -12,7 +12,11 @@ import git
 from git import Repo
 
 # Import test integration for real-time feedback
-from claude_git.core.test_integration import CrossSessionTestCoordinator, TestMonitor
+from claude_git.core.test_integration import (
+    CrossSessionTestCoordinator,
+    TestMonitor,
+    has_test_files,
+)
 
 
 class GitNativeRepository:
@@ -361,13 +365,10 @@ class GitNativeRepository:
         commit_message = self._create_thinking_commit_message(thinking_text)
 
         # Stage all changed files
-        changed_files = []
-        for change in self._accumulated_changes:
-            file_path = change["file_path"]
-            rel_path = (
-                Path(file_path).resolve().relative_to(self.project_root.resolve())
-            )
-            changed_files.append(str(rel_path))
+        changed_files = [
+            self._relative_path(change["file_path"])
+            for change in self._accumulated_changes
+        ]
 
         # Remove duplicates while preserving order
         unique_files = []
@@ -449,14 +450,7 @@ class GitNativeRepository:
 
         # Add structured metadata
         files_changed = list(
-            {
-                str(
-                    Path(c["file_path"])
-                    .resolve()
-                    .relative_to(self.project_root.resolve())
-                )
-                for c in self._accumulated_changes
-            }
+            {self._relative_path(c["file_path"]) for c in self._accumulated_changes}
         )
 
         metadata_lines = [
@@ -478,11 +472,7 @@ class GitNativeRepository:
                 "session_id": self._current_session_id,
                 "timestamp": datetime.now().isoformat(),
                 "files": [
-                    str(
-                        Path(c["file_path"])
-                        .resolve()
-                        .relative_to(self.project_root.resolve())
-                    )
+                    self._relative_path(c["file_path"])
                     for c in self._accumulated_changes
                 ],
                 "tools": [c["tool_name"] for c in self._accumulated_changes],
@@ -500,6 +490,10 @@ class GitNativeRepository:
         except Exception as e:
             print(f"⚠️  Error adding git notes: {e}")
 
+    def _relative_path(self, file_path: str) -> str:
+        """Get a file's path relative to the (already resolved) project root."""
+        return str(Path(file_path).resolve().relative_to(self.project_root))
+
     def _sync_file_to_claude_repo(self, file_path: str) -> None:
         """Sync a specific file from main repo to claude-git repo."""
         try:
@@ -508,7 +502,7 @@ class GitNativeRepository:
                 print(f"⚠️  Source file does not exist: {file_path}")
                 return
 
-            rel_path = source_file.resolve().relative_to(self.project_root.resolve())
+            rel_path = self._relative_path(file_path)
             target_file = self.claude_git_dir / rel_path
 
             # Ensure target directory exists
@@ -530,7 +524,7 @@ class GitNativeRepository:
         self._sync_file_to_claude_repo(file_path)
 
         # Create simple commit message
-        rel_path = Path(file_path).resolve().relative_to(self.project_root.resolve())
+        rel_path = self._relative_path(file_path)
         commit_message = (
             f"claude: {tool_name.lower()} {rel_path}\n\n"
             f"Parent-Repo: {self._get_main_repo_commit()}\n"
@@ -539,7 +533,7 @@ class GitNativeRepository:
 
         try:
             # Stage and commit
-            self.claude_repo.index.add([str(rel_path)])
+            self.claude_repo.index.add([rel_path])
             commit = self.claude_repo.index.commit(commit_message)
             print(f"✅ Created immediate commit: {commit.hexsha[:8]}")
 
@@ -596,7 +590,7 @@ class GitNativeRepository:
                     continue
 
                 if item.is_file():
-                    rel_path = item.resolve().relative_to(self.project_root.resolve())
+                    rel_path = item.relative_to(self.project_root)
                     claude_file = self.claude_git_dir / rel_path
 
                     # Check if files are different
@@ -1326,19 +1320,15 @@ Time: {datetime.now().isoformat()}
             self.project_root / "test",
         ]
 
-        # Check for test files in common patterns
-        test_file_patterns = ["test_*.py", "*_test.py", "tests/*.py"]
-
         # If any test indicators exist, enable monitoring
         if any(indicator.exists() for indicator in test_indicators):
             print("🧪 Test monitoring enabled: Found test configuration/directories")
             return True
 
-        # Check for test files using glob patterns
-        for pattern in test_file_patterns:
-            if any(self.project_root.glob(pattern)):
-                print(f"🧪 Test monitoring enabled: Found test files ({pattern})")
-                return True
+        # Check for test_*.py / *_test.py files in the project root
+        if has_test_files(self.project_root):
+            print("🧪 Test monitoring enabled: Found test files")
+            return True
 
         print("ℹ️  Test monitoring disabled: No test configuration detected")
         return False
@@ -1420,14 +1410,99 @@ Time: {datetime.now().isoformat()}
         cmd = ["git", "-C", str(self.claude_git_dir)] + args
         return subprocess.run(cmd, capture_output=True, text=True, check=False)
 
-    def get_meaningful_diff(self, *args, **kwargs) -> Dict[str, Any]:
-        """Get meaningful diff (compatibility method)."""
-        # Simple implementation - return minimal structure for compatibility
-        result = self.run_git_command(["diff"])
-        diff_text = result.stdout if result.returncode == 0 else ""
+    def get_meaningful_diff(
+        self, limit: int = 10, paths: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get meaningful diff of uncommitted changes in the claude-git repo.
+
+        One ``git diff HEAD`` call produces the hunks for every changed file;
+        each file's header routes its hunks to that file's analysis entry.
+        """
+        file_diffs = self._run_bulk_diff(paths)
+
+        return {
+            "changes_analyzed": [
+                self._analyze_changed_file(rel_path, diff_lines)
+                for rel_path, diff_lines in list(file_diffs.items())[:limit]
+            ]
+        }
+
+    def _run_bulk_diff(self, paths: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """Diff the claude-git worktree against HEAD in one git call, split per file."""
+        # Pin the header format so user diff config cannot change it
+        args = [
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--no-renames",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            "HEAD",
+        ]
+        if paths:
+            args += ["--", *paths]
+
+        result = self.run_git_command(args)
+        if result.returncode != 0:
+            return {}
+
+        file_diffs: Dict[str, List[str]] = {}
+        current_lines: Optional[List[str]] = None
+
+        for line in result.stdout.splitlines():
+            if line.startswith("diff --git "):
+                # A type change emits two consecutive blocks for the same path
+                path = self._diff_header_path(line)
+                current_lines = file_diffs.setdefault(path, [])
+            if current_lines is not None:
+                current_lines.append(line)
+
+        return file_diffs
+
+    @staticmethod
+    def _diff_header_path(header: str) -> str:
+        """Extract the file path from a ``diff --git a/<path> b/<path>`` line."""
+        # Without renames both sides name the same path, so take the first half
+        sides = header[len("diff --git ") :]
+        source = sides[: (len(sides) - 1) // 2]
+
+        # Paths with quotes, backslashes or control characters stay C-quoted
+        if source.startswith('"'):
+            source = (
+                source[1:-1]
+                .encode()
+                .decode("unicode_escape")
+                .encode("latin-1")
+                .decode()
+            )
+
+        return source[len("a/") :]
+
+    def _analyze_changed_file(
+        self, rel_path: str, diff_lines: List[str]
+    ) -> Dict[str, Any]:
+        """Build a diff analysis entry for a single changed file."""
+        # Uncommitted fork changes are not yet attributed to Claude or the user
+        change = {
+            "file_path": rel_path,
+            "change_type": "edit",
+            "status": "pending",
+            "diff_lines": diff_lines,
+        }
+
+        # A type change is two blocks and stays an edit; one block may add or delete
+        if sum(line.startswith("diff --git ") for line in diff_lines) == 1:
+            # File mode changes only appear in the extended header lines
+            header = "\n".join(diff_lines[1:3])
+            if "deleted file mode" in header:
+                change["change_type"] = "delete"
+                change["status"] = "file_not_found"
+            elif "new file mode" in header:
+                change["change_type"] = "write"
 
-        # Return expected dictionary format
-        return {"changes_analyzed": [{"diff": diff_text}] if diff_text.strip() else []}
+        return change
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session info (compatibility method)."""
@@ -1435,18 +1510,57 @@ Time: {datetime.now().isoformat()}
         return sessions.get(session_id)
 
     def _get_parent_repo_status(self) -> Dict[str, Any]:
-        """Get parent repo status (compatibility method)."""
+        """Get parent repo status (compatibility method).
+
+        ``status`` holds the raw ``git status --porcelain=v2 -z`` output, with
+        NUL-separated entries; the file lists are parsed from it.
+        """
+        status = {
+            "has_changes": False,
+            "status": "",
+            "modified_files": [],
+            "added_files": [],
+            "untracked_files": [],
+        }
+
         try:
             result = subprocess.run(
-                ["git", "-C", str(self.project_root), "status", "--porcelain"],
+                [
+                    "git",
+                    "-C",
+                    str(self.project_root),
+                    "status",
+                    "--porcelain=v2",
+                    "--untracked-files=all",
+                    "--no-renames",
+                    "-z",
+                ],
                 capture_output=True,
                 text=True,
                 check=False,
             )
-
-            return {"has_changes": bool(result.stdout.strip()), "status": result.stdout}
         except Exception:
-            return {"has_changes": False, "status": ""}
+            return status
+
+        # Entries are NUL-terminated: "1 XY ... <path>", "u XY ... <path>", "? <path>"
+        for entry in result.stdout.split("\0"):
+            if entry.startswith("? "):
+                status["untracked_files"].append(entry[2:])
+            elif entry.startswith("1 "):
+                xy, path = entry[2:4], entry.split(" ", 8)[8]
+                key = "added_files" if xy[0] == "A" else "modified_files"
+                status[key].append(path)
+            elif entry.startswith("u "):
+                status["modified_files"].append(entry.split(" ", 10)[10])
+
+        status["has_changes"] = bool(result.stdout.strip())
+        status["status"] = result.stdout
+        return status
+
+    def list_commit_paths(self, commit_hash: str) -> List[str]:
+        """List every file path in a commit's tree with a single ls-tree call."""
+        output = self.claude_repo.git.ls_tree("-r", "-z", "--name-only", commit_hash)
+        return [path for path in output.split("\0") if path]
 
     def get_meaningful_diff_for_commit(self, commit_hash: str) -> str:
         """Get meaningful diff for commit (compatibility method)."""
@@ -7,6 +7,7 @@ The system should now properly capture Claude's thinking process and create logi
 commits with conversation history stored in git notes.
 """
 
+import os
 import subprocess
 import threading
 import time
@@ -16,6 +17,19 @@ from typing import Any, Dict, List, Optional
 # import psutil  # Not needed for current functionality
 
 
+def has_test_files(directory: Path) -> bool:
+    """Check for test_*.py / *_test.py files with a single directory scan."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(
+                entry.name.endswith(".py")
+                and (entry.name.startswith("test_") or entry.name.endswith("_test.py"))
+                for entry in entries
+            )
+    except OSError:
+        return False
+
+
 class TestMonitor:
     """
     Real-time test monitoring for Claude sessions using pytest-testmon.
@@ -49,11 +63,7 @@ class TestMonitor:
 
         has_pytest_config = any(f.exists() for f in config_files)
         has_test_dir = (self.project_root / "tests").exists()
-        has_test_files = any(self.project_root.glob("test_*.py")) or any(
-            self.project_root.glob("*_test.py")
-        )
-
-        if has_pytest_config or has_test_dir or has_test_files:
+        if has_pytest_config or has_test_dir or has_test_files(self.project_root):
             return ["python", "-m", "pytest", "--testmon"]
         # Fallback to basic python unittest discovery
         return ["python", "-m", "unittest", "discover"]
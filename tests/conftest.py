@@ -0,0 +1,50 @@
+"""Shared pytest fixtures for claude-git tests."""
+
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+from git import Repo
+
+
+def _commit_project_files(project_path: Path, files: Dict[str, str]) -> None:
+    """Initialize a git repository and commit the given files to it."""
+    main_repo = Repo.init(project_path)
+
+    # Configure git user for testing
+    with main_repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+
+    for rel_path, content in files.items():
+        file_path = project_path / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+
+    main_repo.index.add(list(files))
+    main_repo.index.commit("Initial commit")
+    main_repo.close()
+
+
+@pytest.fixture(scope="session")
+def git_project_factory(tmp_path_factory) -> Callable[[Dict[str, str], Path], Path]:
+    """Copy committed main repositories that are built once per file map.
+
+    The returned callable takes a ``{relative path: content}`` map and a
+    destination, and copies the matching template repository there.
+    """
+    templates: Dict[Tuple[Tuple[str, str], ...], Path] = {}
+
+    def copy_project(files: Dict[str, str], dest: Path) -> Path:
+        key = tuple(sorted(files.items()))
+        if key not in templates:
+            template_path = tmp_path_factory.mktemp("git_project")
+            _commit_project_files(template_path, files)
+            templates[key] = template_path
+
+        # The main repo stores no absolute paths, so a plain copy is independent
+        shutil.copytree(templates[key], dest, symlinks=True)
+        return dest
+
+    return copy_project
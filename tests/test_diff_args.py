@@ -0,0 +1,43 @@
+"""Tests for git-style argument parsing in the claude-git diff command."""
+
+import pytest
+
+from claude_git.cli.main import _parse_diff_args
+
+
+def _parsed(commit_range=None, single_commit=None, paths=(), options=()):
+    return {
+        "commit_range": commit_range,
+        "single_commit": single_commit,
+        "paths": list(paths),
+        "options": list(options),
+    }
+
+
+CASES = [
+    ([], _parsed()),
+    (["HEAD~1"], _parsed(single_commit="HEAD~1")),
+    (["abcdef1"], _parsed(single_commit="abcdef1")),
+    (["HEAD~2..HEAD"], _parsed(commit_range="HEAD~2..HEAD")),
+    (["main...feature"], _parsed(commit_range="main...feature")),
+    (["HEAD~1", "src/"], _parsed(single_commit="HEAD~1", paths=["src/"])),
+    (["file1.txt"], _parsed(paths=["file1.txt"])),
+    (["--", "file1.txt"], _parsed(paths=["file1.txt"])),
+    (
+        ["HEAD~1", "--", "a.py", "b.py"],
+        _parsed(single_commit="HEAD~1", paths=["a.py", "b.py"]),
+    ),
+    (
+        ["abc1234..def5678", "src/"],
+        _parsed(commit_range="abc1234..def5678", paths=["src/"]),
+    ),
+    (["--stat", "HEAD~1"], _parsed(single_commit="HEAD~1", options=["--stat"])),
+]
+
+
+@pytest.mark.parametrize(
+    "argv,expected", CASES, ids=[" ".join(argv) or "<empty>" for argv, _ in CASES]
+)
+def test_parse_diff_args(argv, expected):
+    """Test that diff arguments split into commits, ranges, paths and options."""
+    assert _parse_diff_args(argv) == expected
@@ -1,50 +1,45 @@
 """Comprehensive tests for claude-git diff command matching git behavior."""
 
+import os
 import subprocess
-import tempfile
-import time
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
 from git import Repo
 
+from claude_git.cli.main import main
 from claude_git.core.git_native_repository import GitNativeRepository
 
+pytestmark = pytest.mark.slow
+
+# Initial content of file1.txt, shared by the fixture and tests that edit it
+FILE1_INITIAL = "Line 1\nLine 2\nLine 3\n"
+
+# CliRunner keeps no state between invocations, so one instance serves every test
+CLI_RUNNER = CliRunner()
+
+
+# Files committed to the main repository of every diff test project
+PROJECT_FILES = {
+    "file1.txt": FILE1_INITIAL,
+    "file2.py": "def hello():\n    print('Hello')\n",
+    "README.md": "# Test Project\n",
+    "src/main.py": "import sys\n\ndef main():\n    print('Main')\n",
+}
+
 
 @pytest.fixture
-def temp_diff_project():
+def temp_diff_project(git_project_factory, tmp_path):
     """Create a temporary project with git and claude-git repositories for diff testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_path = Path(temp_dir)
-
-        # Initialize main git repository
-        main_repo = Repo.init(project_path)
-
-        # Configure git user for testing
-        with main_repo.config_writer() as config:
-            config.set_value("user", "name", "Test User")
-            config.set_value("user", "email", "test@example.com")
-
-        # Create initial files
-        (project_path / "file1.txt").write_text("Line 1\nLine 2\nLine 3\n")
-        (project_path / "file2.py").write_text("def hello():\n    print('Hello')\n")
-        (project_path / "README.md").write_text("# Test Project\n")
-
-        # Create subdirectory with files
-        (project_path / "src").mkdir()
-        (project_path / "src" / "main.py").write_text(
-            "import sys\n\ndef main():\n    print('Main')\n"
-        )
-
-        # Initial commit in main repo
-        main_repo.index.add(["file1.txt", "file2.py", "README.md", "src/main.py"])
-        main_repo.index.commit("Initial commit")
+    project_path = git_project_factory(PROJECT_FILES, tmp_path / "project")
+    main_repo = Repo(project_path)
 
-        # Initialize git-native claude repository
-        git_native = GitNativeRepository(project_path)
-        git_native.init()
+    # Initialize git-native claude repository
+    git_native = GitNativeRepository(project_path)
+    git_native.init()
 
-        yield project_path, git_native, main_repo
+    yield project_path, git_native, main_repo
 
 
 def run_git_diff(repo_dir: Path, args: list) -> tuple[str, int]:
@@ -55,10 +50,16 @@ def run_git_diff(repo_dir: Path, args: list) -> tuple[str, int]:
 
 
 def run_claude_git_diff(project_dir: Path, args: list) -> tuple[str, int]:
-    """Run claude-git diff command and return (stdout, returncode)."""
-    cmd = ["python", "-m", "claude_git.cli.main", "diff", "--no-pager"] + args
-    result = subprocess.run(cmd, cwd=str(project_dir), capture_output=True, text=True)
-    return result.stdout, result.returncode
+    """Run claude-git diff command in-process and return (stdout, exit code)."""
+    original_cwd = os.getcwd()
+    os.chdir(project_dir)
+    try:
+        result = CLI_RUNNER.invoke(
+            main, ["diff", "--no-pager"] + args, catch_exceptions=False
+        )
+    finally:
+        os.chdir(original_cwd)
+    return result.stdout, result.exit_code
 
 
 def test_basic_diff_no_changes(temp_diff_project):
@@ -121,8 +122,8 @@ def test_diff_head_tilde_syntax(temp_diff_project):
         git_native.session_start(f"session-{i}")
 
         test_file = project_path / "file1.txt"
-        content = f"Line 1\nLine 2 - modification {i}\nLine 3\n"
-        test_file.write_text(content)
+        content = f"Line 1\nLine 2 - modification {i}\nLine 3\n".encode()
+        test_file.write_bytes(content)
 
         git_native.accumulate_change(
             str(test_file),
@@ -131,7 +132,6 @@ def test_diff_head_tilde_syntax(temp_diff_project):
         )
 
         git_native.session_end(f"Modification {i}")
-        time.sleep(0.1)  # Ensure different timestamps
 
     # Test HEAD~1 syntax
     claude_out, claude_code = run_claude_git_diff(project_path, ["HEAD~1"])
@@ -150,8 +150,8 @@ def test_diff_commit_range_syntax(temp_diff_project):
         git_native.session_start(f"session-{i}")
 
         test_file = project_path / "file1.txt"
-        content = f"Line 1\nLine 2 - version {i}\nLine 3\n"
-        test_file.write_text(content)
+        content = f"Line 1\nLine 2 - version {i}\nLine 3\n".encode()
+        test_file.write_bytes(content)
 
         git_native.accumulate_change(
             str(test_file),
@@ -160,7 +160,6 @@ def test_diff_commit_range_syntax(temp_diff_project):
         )
 
         git_native.session_end(f"Version {i}")
-        time.sleep(0.1)
 
     # Test range syntax
     claude_out, claude_code = run_claude_git_diff(project_path, ["HEAD~2..HEAD"])
@@ -287,11 +286,10 @@ def test_diff_limit_option(temp_diff_project):
         git_native.session_start(f"limit-session-{i}")
 
         test_file = project_path / f"file_{i}.txt"
-        test_file.write_text(f"Content for file {i}\n")
+        test_file.write_bytes(f"Content for file {i}\n".encode())
         git_native.accumulate_change(str(test_file), "Write", {})
 
         git_native.session_end(f"Change {i}")
-        time.sleep(0.1)
 
     # Test with limit
     claude_out, claude_code = run_claude_git_diff(project_path, ["--limit", "2"])
@@ -343,8 +341,7 @@ def test_diff_output_format_matches_git_style(temp_diff_project):
     git_native.session_start("format-test")
 
     test_file = project_path / "file1.txt"
-    original_content = test_file.read_text()
-    modified_content = original_content.replace("Line 2", "Line 2 - MODIFIED")
+    modified_content = FILE1_INITIAL.replace("Line 2", "Line 2 - MODIFIED")
     test_file.write_text(modified_content)
 
     git_native.accumulate_change(
@@ -428,22 +425,21 @@ def test_git_diff_compatibility_comprehensive(temp_diff_project):
 
     # Create a sequence of changes
     changes = [
-        ("file1.txt", "First change\n"),
-        ("file2.py", "def updated():\n    return 'updated'\n"),
-        ("new_file.md", "# New Document\nContent here\n"),
+        ("file1.txt", b"First change\n"),
+        ("file2.py", b"def updated():\n    return 'updated'\n"),
+        ("new_file.md", b"# New Document\nContent here\n"),
     ]
 
     for i, (filename, content) in enumerate(changes):
         git_native.session_start(f"compat-session-{i}")
 
         file_path = project_path / filename
-        file_path.write_text(content)
+        file_path.write_bytes(content)
         git_native.accumulate_change(
             str(file_path), "Edit" if file_path.exists() else "Write", {}
         )
 
         git_native.session_end(f"Change {i}")
-        time.sleep(0.1)
 
     # Test various git-style commands that should work similarly
     test_cases = [
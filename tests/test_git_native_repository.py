@@ -1,7 +1,6 @@
 """Tests for GitNativeRepository dual-repository architecture."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -10,34 +9,32 @@ from git import Repo
 from claude_git.core.git_native_repository import GitNativeRepository
 
 
-@pytest.fixture
-def temp_git_project():
-    """Create a temporary git project with some files for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_path = Path(temp_dir)
+def _commit_count(repo):
+    """Count the commits reachable from HEAD without loading them."""
+    return int(repo.git.rev_list("--count", "HEAD"))
 
-        # Initialize a real git repository
-        main_repo = Repo.init(project_path)
 
-        # Configure git user for testing
-        with main_repo.config_writer() as config:
-            config.set_value("user", "name", "Test User")
-            config.set_value("user", "email", "test@example.com")
+# Files committed to the main repository of every test project
+PROJECT_FILES = {
+    "main.py": "def main():\n    print('Hello')\n",
+    "utils.py": "def helper():\n    return 42\n",
+    "README.md": "# Test Project\n",
+    "src/core.py": "class Core:\n    pass\n",
+}
 
-        # Create some initial files
-        (project_path / "main.py").write_text("def main():\n    print('Hello')\n")
-        (project_path / "utils.py").write_text("def helper():\n    return 42\n")
-        (project_path / "README.md").write_text("# Test Project\n")
 
-        # Create a subdirectory with files
-        (project_path / "src").mkdir()
-        (project_path / "src" / "core.py").write_text("class Core:\n    pass\n")
+@pytest.fixture
+def temp_git_project(git_project_factory, tmp_path):
+    """Create a temporary git project with some files for testing."""
+    return git_project_factory(PROJECT_FILES, tmp_path / "project")
 
-        # Make initial commit in main repo
-        main_repo.index.add(["main.py", "utils.py", "README.md", "src/core.py"])
-        main_repo.index.commit("Initial commit")
 
-        yield project_path
+@pytest.fixture
+def git_native(temp_git_project):
+    """Create an initialized git-native repository for the temp project."""
+    repo = GitNativeRepository(temp_git_project)
+    repo.init()
+    return repo
 
 
 def test_git_native_repository_init(temp_git_project):
@@ -75,11 +72,8 @@ def test_git_native_repository_init(temp_git_project):
     assert main_content == claude_content
 
 
-def test_session_management(temp_git_project):
+def test_session_management(git_native):
     """Test Claude session start and end functionality."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Initially no session should be active
     assert not git_native._session_active
     assert git_native._current_session_id is None
@@ -99,11 +93,8 @@ def test_session_management(temp_git_project):
     assert git_native._current_session_id is None
 
 
-def test_change_accumulation(temp_git_project):
+def test_change_accumulation(temp_git_project, git_native):
     """Test accumulating changes during a session."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Start session
     git_native.session_start("test-session")
 
@@ -131,11 +122,8 @@ def test_change_accumulation(temp_git_project):
     assert claude_file.read_text() == "def main():\n    print('Hello, World!')\n"
 
 
-def test_session_end_with_thinking_text(temp_git_project):
+def test_session_end_with_thinking_text(temp_git_project, git_native):
     """Test creating logical commit with thinking text."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Start session and make changes
     git_native.session_start("thinking-session")
 
@@ -172,11 +160,8 @@ def test_session_end_with_thinking_text(temp_git_project):
     assert git_native._accumulated_changes == []
 
 
-def test_immediate_commit_outside_session(temp_git_project):
+def test_immediate_commit_outside_session(temp_git_project, git_native):
     """Test creating immediate commits when no session is active."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Make a change without starting session
     test_file = temp_git_project / "utils.py"
     test_file.write_text("def helper():\n    return 'immediate'\n")
@@ -187,27 +172,22 @@ def test_immediate_commit_outside_session(temp_git_project):
     )
 
     # Check that a commit was created
-    commits = list(git_native.claude_repo.iter_commits())
     # Should have at least 2 commits: initial + this immediate commit
-    assert len(commits) >= 2
+    assert _commit_count(git_native.claude_repo) >= 2
 
     # Find the immediate commit
-    immediate_commit = None
-    for commit in commits:
-        if "claude: write utils.py" in commit.message:
-            immediate_commit = commit
-            break
+    shas = git_native.claude_repo.git.log(
+        "--fixed-strings", "--grep=claude: write utils.py", "--format=%H"
+    ).splitlines()
 
-    assert immediate_commit is not None
+    assert shas
+    immediate_commit = git_native.claude_repo.commit(shas[0])
     assert "Parent-Repo:" in immediate_commit.message
     assert "Tool: Write" in immediate_commit.message
 
 
-def test_file_synchronization(temp_git_project):
+def test_file_synchronization(temp_git_project, git_native):
     """Test file synchronization between main and claude-git repos."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Create a new file in main repo
     new_file = temp_git_project / "new_feature.py"
     new_file.write_text("# New feature implementation\n")
@@ -225,11 +205,8 @@ def test_file_synchronization(temp_git_project):
     # Should handle gracefully without crashing
 
 
-def test_detect_file_differences(temp_git_project):
+def test_detect_file_differences(temp_git_project, git_native):
     """Test detecting file differences between repos."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Initially no differences
     changes = git_native._detect_file_differences()
     assert changes == []
@@ -251,11 +228,8 @@ def test_detect_file_differences(temp_git_project):
     assert "main.py" in changes
 
 
-def test_user_changes_commit(temp_git_project):
+def test_user_changes_commit(temp_git_project, git_native):
     """Test committing pending user changes before Claude session."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Modify files in main repo (simulating user changes)
     main_file = temp_git_project / "main.py"
     main_file.write_text("def main():\n    print('User modified this')\n")
@@ -264,9 +238,9 @@ def test_user_changes_commit(temp_git_project):
     new_file.write_text("# User created this file\n")
 
     # Start session (should auto-commit user changes)
-    initial_commits = len(list(git_native.claude_repo.iter_commits()))
+    initial_commits = _commit_count(git_native.claude_repo)
     git_native.session_start("user-test-session")
-    final_commits = len(list(git_native.claude_repo.iter_commits()))
+    final_commits = _commit_count(git_native.claude_repo)
 
     # Should have created user commit
     assert final_commits > initial_commits
@@ -280,11 +254,8 @@ def test_user_changes_commit(temp_git_project):
     ).read_text() == "# User created this file\n"
 
 
-def test_git_notes_metadata(temp_git_project):
+def test_git_notes_metadata(temp_git_project, git_native):
     """Test adding structured metadata as git notes."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Start session and make changes
     git_native.session_start("notes-test")
 
@@ -303,12 +274,9 @@ def test_git_notes_metadata(temp_git_project):
     assert "Testing git notes functionality" in commit.message
 
 
-def test_multiple_sessions(temp_git_project):
+def test_multiple_sessions(temp_git_project, git_native):
     """Test multiple sequential sessions."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
-    initial_commits = len(list(git_native.claude_repo.iter_commits()))
+    initial_commits = _commit_count(git_native.claude_repo)
 
     # Session 1
     git_native.session_start("session-1")
@@ -325,7 +293,7 @@ def test_multiple_sessions(temp_git_project):
     commit2 = git_native.session_end("Second session thinking")
 
     # Verify both commits exist
-    final_commits = len(list(git_native.claude_repo.iter_commits()))
+    final_commits = _commit_count(git_native.claude_repo)
     assert final_commits == initial_commits + 2
 
     assert commit1 != commit2
@@ -342,11 +310,8 @@ def test_multiple_sessions(temp_git_project):
     assert "session-2" in c2.message
 
 
-def test_error_handling(temp_git_project):
+def test_error_handling(temp_git_project, git_native):
     """Test error handling in various scenarios."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Test ending session that wasn't started
     commit_hash = git_native.session_end()
     assert commit_hash == ""
@@ -364,11 +329,8 @@ def test_error_handling(temp_git_project):
     git_native.accumulate_change("/invalid/path/file.py", "Edit", {})
 
 
-def test_main_repo_commit_tracking(temp_git_project):
+def test_main_repo_commit_tracking(temp_git_project, git_native):
     """Test tracking main repository commit hashes."""
-    git_native = GitNativeRepository(temp_git_project)
-    git_native.init()
-
     # Get initial main repo commit
     initial_commit = git_native._get_main_repo_commit()
     assert len(initial_commit) == 40  # SHA-1 hash length
@@ -385,3 +347,139 @@ def test_main_repo_commit_tracking(temp_git_project):
     updated_commit = git_native._get_main_repo_commit()
     assert updated_commit == new_commit.hexsha
     assert updated_commit != initial_commit
+
+
+def test_get_meaningful_diff_only_reports_changed_files(temp_git_project, git_native):
+    """Test that meaningful diff only reports files that differ from HEAD."""
+    # No uncommitted changes in the claude-git repo yet
+    assert git_native.get_meaningful_diff()["changes_analyzed"] == []
+
+    # Sync a modified file without committing it
+    main_file = temp_git_project / "main.py"
+    main_file.write_text("def main():\n    print('Changed')\n")
+    git_native._sync_file_to_claude_repo(str(main_file))
+
+    changes = git_native.get_meaningful_diff()["changes_analyzed"]
+    assert [c["file_path"] for c in changes] == ["main.py"]
+    assert changes[0]["change_type"] == "edit"
+    assert changes[0]["status"] == "pending"
+    assert "+    print('Changed')" in changes[0]["diff_lines"]
+
+
+def test_get_meaningful_diff_routes_hunks_per_file(temp_git_project, git_native):
+    """Test that a bulk diff is split back into per-file analysis entries."""
+    for name in ["main.py", "utils.py", "src/core.py"]:
+        changed_file = temp_git_project / name
+        changed_file.write_text(f"# rewritten {name}\n")
+        git_native._sync_file_to_claude_repo(str(changed_file))
+
+    changes = git_native.get_meaningful_diff()["changes_analyzed"]
+    assert len(changes) == 3
+
+    for change in changes:
+        assert change["diff_lines"][0].startswith(f"diff --git a/{change['file_path']}")
+        assert f"+# rewritten {change['file_path']}" in change["diff_lines"]
+
+
+def test_get_meaningful_diff_ignores_user_diff_header_config(
+    temp_git_project, git_native
+):
+    """Test that quoted or unprefixed diff headers still map hunks to files."""
+    with git_native.claude_repo.config_writer() as config:
+        config.set_value("diff", "noprefix", "true")
+        config.set_value("core", "quotePath", "true")
+
+    for name in ["café.py", "main.py", 'say "hi".py']:
+        changed_file = temp_git_project / name
+        changed_file.write_text(f"# rewritten {name}\n")
+        git_native._sync_file_to_claude_repo(str(changed_file))
+    git_native.claude_repo.git.add("café.py", 'say "hi".py')
+
+    changes = git_native.get_meaningful_diff()["changes_analyzed"]
+    assert [c["file_path"] for c in changes] == ["café.py", "main.py", 'say "hi".py']
+    assert [c["change_type"] for c in changes] == ["write", "edit", "write"]
+
+    for change in changes:
+        assert f"+# rewritten {change['file_path']}" in change["diff_lines"]
+
+
+def test_get_meaningful_diff_keeps_type_change_blocks_together(git_native):
+    """Test that a file replaced by a symlink does not shift later files' hunks."""
+    # A type change produces a deletion block and a creation block for one path
+    linked_file = git_native.claude_git_dir / "main.py"
+    linked_file.unlink()
+    linked_file.symlink_to("README.md")
+
+    edited_file = git_native.project_root / "utils.py"
+    edited_file.write_text("def helper():\n    return 0\n")
+    git_native._sync_file_to_claude_repo(str(edited_file))
+
+    changes = git_native.get_meaningful_diff()["changes_analyzed"]
+    assert [c["file_path"] for c in changes] == ["main.py", "utils.py"]
+    assert [c["change_type"] for c in changes] == ["edit", "edit"]
+
+    type_change, edit = changes
+    assert "deleted file mode 100644" in type_change["diff_lines"]
+    assert "new file mode 120000" in type_change["diff_lines"]
+    assert all(
+        not line.startswith("diff --git a/main.py") for line in edit["diff_lines"]
+    )
+    assert "+    return 0" in edit["diff_lines"]
+
+
+def test_list_commit_paths(git_native):
+    """Test listing the files recorded in a claude-git commit."""
+    head = git_native.claude_repo.head.commit.hexsha
+    paths = git_native.list_commit_paths(head)
+
+    assert ".claude-git-config.json" in paths
+    assert "src/core.py" in paths
+    assert "src" not in paths  # Only blobs, no tree entries
+
+
+def test_parent_repo_status_classifies_files(temp_git_project):
+    """Test that parent repo status splits modified, added and untracked files."""
+    git_native = GitNativeRepository(temp_git_project)
+
+    status = git_native._get_parent_repo_status()
+    assert status["has_changes"] is False
+    assert status["modified_files"] == []
+
+    (temp_git_project / "utils.py").write_text("def helper():\n    return 2\n")
+    (temp_git_project / "staged new.py").write_text("x = 1\n")
+    Repo(temp_git_project).index.add(["staged new.py"])
+    (temp_git_project / "src" / "scratch.py").write_text("y = 2\n")
+
+    status = git_native._get_parent_repo_status()
+    assert status["has_changes"] is True
+    assert status["modified_files"] == ["utils.py"]
+    assert status["added_files"] == ["staged new.py"]
+    assert status["untracked_files"] == ["src/scratch.py"]
+
+
+def test_sessions_metadata_cache_tracks_file_changes(git_native):
+    """Test that cached session metadata is refreshed when the file changes."""
+    assert git_native.get_active_sessions() == {}
+
+    git_native._update_session_metadata("s1", "session-a", "/tmp/a", "auth")
+    assert list(git_native.get_active_sessions()) == ["s1"]
+
+    # Another process rewrites the metadata file
+    git_native.sessions_metadata_file.write_text(
+        json.dumps({"s2": {"status": "active", "created_at": "now"}})
+    )
+    assert list(git_native.get_active_sessions()) == ["s2"]
+
+
+def test_get_meaningful_diff_detects_deleted_files(git_native):
+    """Test that files removed from the claude-git repo are reported as deleted."""
+    (git_native.claude_git_dir / "utils.py").unlink()
+
+    changes = git_native.get_meaningful_diff()["changes_analyzed"]
+    assert len(changes) == 1
+    assert changes[0]["change_type"] == "delete"
+    assert changes[0]["status"] == "file_not_found"
+
+    diff_text = "\n".join(changes[0]["diff_lines"])
+    assert "\n--- a/utils.py" in diff_text
+    assert "\n+++ /dev/null" in diff_text
@@ -1,32 +1,17 @@
 """Tests for claude-git init safety checks."""
 
-import tempfile
-from pathlib import Path
+import json
+import shutil
 
 import pytest
-from git import Repo
 
 from claude_git.core.git_native_repository import GitNativeRepository
 
 
 @pytest.fixture
-def temp_git_project():
+def temp_git_project(git_project_factory, tmp_path):
     """Create a temporary git project for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_path = Path(temp_dir)
-
-        # Initialize git repo
-        main_repo = Repo.init(project_path)
-        with main_repo.config_writer() as config:
-            config.set_value("user", "name", "Test User")
-            config.set_value("user", "email", "test@example.com")
-
-        # Create test file and commit
-        (project_path / "test.py").write_text("print('test')\n")
-        main_repo.index.add(["test.py"])
-        main_repo.index.commit("Initial commit")
-
-        yield project_path
+    return git_project_factory({"test.py": "print('test')\n"}, tmp_path / "project")
 
 
 def test_init_refuses_to_overwrite_existing_git_native_repo(temp_git_project):
@@ -71,8 +56,6 @@ def test_init_allows_empty_claude_git_directory(temp_git_project):
 def test_init_requires_git_repository(temp_git_project):
     """Test that init requires a git repository to exist."""
     # Remove the .git directory
-    import shutil
-
     shutil.rmtree(temp_git_project / ".git")
 
     # Try to initialize - should fail
@@ -93,8 +76,6 @@ def test_init_creates_proper_structure(temp_git_project):
 
     # Verify config file content
     config_file = temp_git_project / ".claude-git" / ".claude-git-config.json"
-    import json
-
     config = json.loads(config_file.read_text())
     assert config["version"] == "2.0.0"
     assert config["architecture"] == "git-native-dual-repo"
@@ -7,7 +7,6 @@ realistic development scenarios with mixed user and Claude changes.
 """
 
 import subprocess
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -20,28 +19,27 @@ class TestMixedWorkflow:
     """Test suite for mixed user/Claude development workflow."""
 
     @pytest.fixture
-    def temp_mixed_project(self):
+    def temp_mixed_project(self, tmp_path):
         """Create a temporary project with mixed user/Claude changes."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
+        project_path = tmp_path
 
-            # Initialize main git repository
-            main_repo = Repo.init(project_path)
-            with main_repo.config_writer() as config:
-                config.set_value("user", "name", "Test User")
-                config.set_value("user", "email", "user@test.com")
+        # Initialize main git repository
+        main_repo = Repo.init(project_path)
+        with main_repo.config_writer() as config:
+            config.set_value("user", "name", "Test User")
+            config.set_value("user", "email", "user@test.com")
 
-            # Create initial user files
-            (project_path / "main.py").write_text("def main():\n    pass\n")
-            (project_path / "README.md").write_text("# Test Project\n")
-            main_repo.index.add(["main.py", "README.md"])
-            main_repo.index.commit("Initial user commit")
+        # Create initial user files
+        (project_path / "main.py").write_text("def main():\n    pass\n")
+        (project_path / "README.md").write_text("# Test Project\n")
+        main_repo.index.add(["main.py", "README.md"])
+        main_repo.index.commit("Initial user commit")
 
-            # Initialize claude-git
-            git_native = GitNativeRepository(project_path)
-            git_native.init()
+        # Initialize claude-git
+        git_native = GitNativeRepository(project_path)
+        git_native.init()
 
-            yield project_path, git_native
+        yield project_path, git_native
 
     def test_user_then_claude_changes(self, temp_mixed_project):
         """Test user changes followed by Claude changes."""
@@ -58,11 +56,12 @@ class TestMixedWorkflow:
 
         # Simulate Claude changes
         claude_file = project_path / "claude_helper.py"
-        claude_file.write_text(
+        claude_content = (
             "# Claude added this helper\ndef helper():\n    return 'helped'\n"
         )
+        claude_file.write_text(claude_content)
         git_native.accumulate_change(
-            str(claude_file), "Write", {"content": claude_file.read_text()}
+            str(claude_file), "Write", {"content": claude_content}
         )
 
         # End Claude session
@@ -133,7 +132,7 @@ class TestMixedWorkflow:
 
         for filename, content in test_files.items():
             file_path = project_path / filename
-            file_path.write_text(content)
+            file_path.write_bytes(content.encode())
             git_native.accumulate_change(str(file_path), "Write", {"content": content})
 
         commit_hash = git_native.session_end("Created various file types for testing")
@@ -205,15 +204,11 @@ class TestMixedWorkflow:
         git_native.accumulate_change(str(standalone_file), "Write", {})
 
         # Verify immediate commit was created
-        commits = list(git_native.claude_repo.iter_commits())
-        immediate_commit = None
-        for commit in commits:
-            if "write standalone.py" in commit.message.lower():
-                immediate_commit = commit
-                break
-
-        assert immediate_commit is not None
-        assert "standalone.py" in immediate_commit.message
+        messages = git_native.claude_repo.git.log(
+            "--fixed-strings", "-i", "--grep=write standalone.py", "--format=%B"
+        )
+
+        assert "standalone.py" in messages
 
 
 def test_repository_health_validation():
@@ -15,6 +15,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from git import Repo
 
 from claude_git.core.git_native_repository import GitNativeRepository
 from claude_git.hooks.session_end import extract_chronological_thinking_and_changes
@@ -24,30 +25,22 @@ class TestThinkingCollectionE2E:
     """End-to-end tests for the complete thinking collection system."""
 
     @pytest.fixture
-    def temp_repo(self):
+    def temp_repo(self, tmp_path):
         """Create a temporary git repository for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            repo_path = Path(temp_dir)
+        repo_path = tmp_path
 
-            # Initialize git repo
-            subprocess.run(["git", "init"], cwd=repo_path, check=True)
-            subprocess.run(
-                ["git", "config", "user.name", "Test"], cwd=repo_path, check=True
-            )
-            subprocess.run(
-                ["git", "config", "user.email", "test@example.com"],
-                cwd=repo_path,
-                check=True,
-            )
+        # Initialize git repo
+        main_repo = Repo.init(repo_path)
+        with main_repo.config_writer() as config:
+            config.set_value("user", "name", "Test")
+            config.set_value("user", "email", "test@example.com")
 
-            # Create initial commit
-            (repo_path / "initial.txt").write_text("initial content")
-            subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-            subprocess.run(
-                ["git", "commit", "-m", "initial commit"], cwd=repo_path, check=True
-            )
+        # Create initial commit
+        (repo_path / "initial.txt").write_text("initial content")
+        main_repo.index.add(["initial.txt"])
+        main_repo.index.commit("initial commit")
 
-            yield repo_path
+        yield repo_path
 
     @pytest.fixture
     def claude_git_repo(self, temp_repo):
@@ -160,8 +153,7 @@ class TestThinkingCollectionE2E:
 
         # Clean up
         sample_transcript.unlink()
-        if debug_log.exists():
-            debug_log.unlink()
+        debug_log.unlink(missing_ok=True)
 
     def test_session_lifecycle_management(self, claude_git_repo, temp_repo):
         """Test complete session start → accumulate changes → end with thinking."""
@@ -294,8 +286,7 @@ Then I added a helper utility function for common operations. The architecture s
 
         # Clean up
         sample_transcript.unlink()
-        if debug_log.exists():
-            debug_log.unlink()
+        debug_log.unlink(missing_ok=True)
 
     def test_git_notes_storage(self, claude_git_repo, temp_repo):
         """Test that structured data is stored in git notes."""
@@ -357,7 +348,7 @@ Then I added a helper utility function for common operations. The architecture s
 
         for filename, content in files_to_create.items():
             file_path = temp_repo / filename
-            file_path.write_text(content)
+            file_path.write_bytes(content.encode())
             claude_git_repo.accumulate_change(
                 str(file_path), "Write", {"content": content}
             )
@@ -431,8 +422,7 @@ Created the user model for data representation, added view functions for user in
         assert commit_hash is not None
 
         # Clean up
-        if debug_log.exists():
-            debug_log.unlink()
+        debug_log.unlink(missing_ok=True)
 
     def test_empty_session_handling(self, claude_git_repo):
         """Test handling of sessions with no changes accumulated."""
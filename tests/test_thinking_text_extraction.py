@@ -25,8 +25,7 @@ class TestThinkingTextExtraction:
     def create_mock_transcript(self, entries: list) -> Path:
         """Create a mock transcript file with given entries."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            for entry in entries:
-                f.write(json.dumps(entry) + "\n")
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
             return Path(f.name)
 
     def test_extract_simple_thinking_text(self):